@@ -15,67 +15,113 @@
 * limitations under the License.
 """
 
-import pathlib
-from collections import namedtuple
+import functools
+import sys
 
 from .constant import CONTEXT_TYPE, PREFIX_MENU
-from .utils import merge_dict
 
-_file_name = pathlib.Path(__file__).stem
+_file_name = __name__.rsplit(".", 1)[-1]
+_CATEGORY = sys.intern(f"{PREFIX_MENU}/{_file_name}")
 
-RemixContext = namedtuple("RemixContext", ["address", "port"])
+
+class RemixContext:
+    """Connection details of the RTX Remix Toolkit passed along the graph"""
+
+    __slots__ = ("address", "port")
+
+    def __init__(self, address: str, port: int):
+        self.address = address
+        self.port = port
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RemixContext):
+            return NotImplemented
+        return self.address == other.address and self.port == other.port
+
+    def __hash__(self) -> int:
+        return hash((self.address, self.port))
+
+    def __repr__(self) -> str:
+        return f"RemixContext(address={self.address!r}, port={self.port!r})"
+
+
+_CONTEXT_INPUTS = {"required": {"context": (CONTEXT_TYPE, {"forceInput": True})}}
+_ENABLED_INPUTS = {"required": {"enable_this_node": ("BOOLEAN", {"default": True})}}
+_REMIX_API_INPUTS = {
+    "required": {"address": ("STRING", {"forceInput": True}), "port": ("INT", {"forceInput": True})},
+}
 
 
 def get_context_inputs() -> dict[str, dict[str, tuple[str, dict]]]:
-    return {"required": {"context": (CONTEXT_TYPE, {"forceInput": True})}}
+    return _CONTEXT_INPUTS
 
 
 def get_enabled_inputs() -> dict[str, dict[str, tuple[str, dict]]]:
-    return {"required": {"enable_this_node": ("BOOLEAN", {"default": True})}}
+    return _ENABLED_INPUTS
 
 
 def get_remix_api_inputs() -> dict[str, dict[str, tuple[str, dict]]]:
-    return {
-        "required": {"address": ("STRING", {"forceInput": True}), "port": ("INT", {"forceInput": True})},
-    }
+    return _REMIX_API_INPUTS
 
 
-def wrap_input_types_with(func, input_fn):
-    """Decorator to wrap the INPUT_TYPES classmethod and add context input"""
+def wrap_input_types_with_many(cls, func, *input_fns):
+    """
+    Wrap the INPUT_TYPES classmethod function of a class and add all the given inputs in a single pass.
+
+    The schema is static for a given class, so the merged result is built once here and returned on every call.
+    """
+    # build new section dicts: func may return a shared dict (e.g. get_context_inputs())
+    input_types = dict(func(cls))
+    for input_fn in input_fns:
+        for section, inputs in input_fn().items():
+            input_types[section] = {**input_types.get(section, {}), **inputs}
 
-    def wrapper(*args, **kwargs):
-        return merge_dict(input_fn(), func())
+    def wrapper(_cls):
+        # subclasses inheriting this wrapper get the schema built for cls.
+        # shared between all the calls: ComfyUI and the nodes must treat the schema as read-only
+        return input_types
 
     return wrapper
 
 
-class ContextExecutionFuncWrapper:
+def context_execution(func):
     """Decorator to wrap the execution function providing context and passing it through"""
 
-    def __init__(self, func):
-        self.func = func
+    @functools.wraps(func)
+    def wrapper(self, *args, context: RemixContext, enable_this_node: bool, **kwargs):
+        # store on instance in case node needs access
+        self.context = context
+        self.enable_this_node = enable_this_node  # we don't return this as output
+        return (context,) + func(self, *args, **kwargs)
 
-    def __get__(self, instance, owner):
-        def wrapper(*args, **kwargs):
-            # store on instance in case node needs access
-            instance.context: RemixContext = kwargs.pop("context")  # noqa
-            instance.enable_this_node: bool = kwargs.pop("enable_this_node")  # noqa, we don't return this as output
-            return (instance.context,) + self.func(instance, *args, **kwargs)
-
-        return wrapper
+    wrapper._context_execution = True
+    return wrapper
 
 
 def add_context_outputs(cls):
     """Node class decorator for adding context outputs"""
     # add it as first return item (will also usually be first input alphabetically)
-    cls.RETURN_TYPES = (CONTEXT_TYPE,) + getattr(cls, "RETURN_TYPES", ())
-    cls.RETURN_NAMES = ("context",) + getattr(cls, "RETURN_NAMES", ())
+    cls.RETURN_TYPES = (CONTEXT_TYPE, *getattr(cls, "RETURN_TYPES", ()))
+    cls.RETURN_NAMES = ("context", *getattr(cls, "RETURN_NAMES", ()))
     # this one is optional
-    if hasattr(cls, "OUTPUT_IS_LIST"):
-        cls.OUTPUT_IS_LIST = (False,) + getattr(cls, "OUTPUT_IS_LIST", ())
+    output_is_list = getattr(cls, "OUTPUT_IS_LIST", None)
+    if output_is_list is not None:
+        cls.OUTPUT_IS_LIST = (False, *output_is_list)
     return cls
 
 
+def _wrap_context_input_types(cls):
+    input_types = wrap_input_types_with_many(cls, cls.INPUT_TYPES.__func__, get_context_inputs, get_enabled_inputs)
+    setattr(cls, "INPUT_TYPES", classmethod(input_types))  # noqa
+
+
+def _wrap_context_execution(cls):
+    function_name = getattr(cls, "FUNCTION")  # noqa
+    func = getattr(cls, function_name)
+    if not getattr(func, "_context_execution", False):
+        setattr(cls, function_name, context_execution(func))
+
+
 def add_context_input_enabled_and_output(cls):
     """
     Node class decorator for adding context inputs and outputs.
@@ -83,20 +129,60 @@ def add_context_input_enabled_and_output(cls):
     This should seamlessly wrap a comfy node class and take care of
     creating the context input and output and piping it through the
     node. Access it using self.context within the execution func.
+
+    Subclasses of an already wrapped class only get the attributes they redefine wrapped.
     """
-    add_context_outputs(cls)
+    if cls.__dict__.get("_context_wrapped", False):
+        # this class itself is already wrapped, e.g. a decorated ContextNode subclass
+        return cls
+    if not getattr(cls, "_context_wrapped", False):
+        add_context_outputs(cls)
+        _wrap_context_input_types(cls)
+        _wrap_context_execution(cls)
+        cls._context_wrapped = True
+        return cls
+
+    attributes = cls.__dict__
+    if "RETURN_TYPES" in attributes:
+        cls.RETURN_TYPES = (CONTEXT_TYPE, *cls.RETURN_TYPES)
+    if "RETURN_NAMES" in attributes:
+        cls.RETURN_NAMES = ("context", *cls.RETURN_NAMES)
+    if "OUTPUT_IS_LIST" in attributes:
+        cls.OUTPUT_IS_LIST = (False, *cls.OUTPUT_IS_LIST)
+    if "INPUT_TYPES" in attributes:
+        _wrap_context_input_types(cls)
+    # also covers a new FUNCTION name or an overridden execution function
+    _wrap_context_execution(cls)
+    return cls
 
-    # wrap input types func
-    setattr(cls, "INPUT_TYPES", wrap_input_types_with(cls.INPUT_TYPES, get_context_inputs))  # noqa
-    setattr(cls, "INPUT_TYPES", wrap_input_types_with(cls.INPUT_TYPES, get_enabled_inputs))  # noqa
 
-    # wrap execution function
-    function_name = getattr(cls, "FUNCTION")  # noqa
-    func = getattr(cls, function_name)
-    wrapped_func = ContextExecutionFuncWrapper(func)
-    setattr(cls, function_name, wrapped_func)
+class ContextNode:
+    """
+    Base class for nodes taking the context input and outputs.
 
-    return cls
+    Every subclass is passed through add_context_input_enabled_and_output when it is created.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        add_context_input_enabled_and_output(cls)
+
+
+_REST_API_INPUT_TYPES = {
+    "required": {
+        "address": ("STRING", {"multiline": False, "default": "127.0.0.1"}),
+        "port": (
+            "INT",
+            {
+                "default": 8011,
+                "min": 0,  # Minimum value
+                "max": 65353,  # Maximum value
+                "step": 1,  # Slider's step
+                "display": "number",  # Cosmetic only: display as "number" or "slider"
+            },
+        ),
+    },
+}
 
 
 class RestAPIDetails:
@@ -104,28 +190,14 @@ class RestAPIDetails:
 
     @classmethod
     def INPUT_TYPES(cls):  # noqa N802
-        return {
-            "required": {
-                "address": ("STRING", {"multiline": False, "default": "127.0.0.1"}),
-                "port": (
-                    "INT",
-                    {
-                        "default": 8011,
-                        "min": 0,  # Minimum value
-                        "max": 65353,  # Maximum value
-                        "step": 1,  # Slider's step
-                        "display": "number",  # Cosmetic only: display as "number" or "slider"
-                    },
-                ),
-            },
-        }
+        return _REST_API_INPUT_TYPES
 
     RETURN_TYPES = ("STRING", "INT")
     RETURN_NAMES = ("address", "port")
 
     FUNCTION = "get_address"
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def get_address(self, address, port):
         return address, port
@@ -137,14 +209,14 @@ class StartContext:
 
     @classmethod
     def INPUT_TYPES(cls):  # noqa N802
-        return {"required": {"address": ("STRING", {"forceInput": True}), "port": ("INT", {"forceInput": True})}}
+        return _REMIX_API_INPUTS
 
     RETURN_TYPES = ()
     RETURN_NAMES = ()
 
     FUNCTION = "execute"
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def execute(self, address, port):
         return (RemixContext(address, port),)
@@ -155,14 +227,14 @@ class EndContext:
 
     @classmethod
     def INPUT_TYPES(cls):  # noqa N802
-        return {"required": {"context": (CONTEXT_TYPE, {"forceInput": True})}}
+        return _CONTEXT_INPUTS
 
     RETURN_TYPES = ()
     RETURN_NAMES = ()
 
     FUNCTION = "execute"
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     OUTPUT_NODE = True
 
@@ -170,49 +242,57 @@ class EndContext:
         return ()
 
 
+_STRING_CONSTANT_INPUT_TYPES = {
+    "required": {
+        "string": ("STRING", {"default": "", "multiline": True}),
+    }
+}
+
+
 class StringConstant:
     """Declare a string constant"""
 
     @classmethod
     def INPUT_TYPES(cls):  # noqa N802
-        return {
-            "required": {
-                "string": ("STRING", {"default": "", "multiline": True}),
-            }
-        }
+        return _STRING_CONSTANT_INPUT_TYPES
 
     RETURN_TYPES = ("STRING",)
     FUNCTION = "get_string"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def get_string(self, string):
         return (string,)
 
 
+_STRING_CONCATENATE_INPUT_TYPES = {
+    "required": {
+        "string1": ("STRING", {"default": "", "forceInput": True}),
+        "string2": ("STRING", {"default": "", "forceInput": True}),
+    },
+    "optional": {
+        "separator": ("STRING", {"default": "_"}),
+    },
+}
+
+
 class StringConcatenate:
     """Concatenate two strings"""
 
     @classmethod
     def INPUT_TYPES(cls):  # noqa N802
-        return {
-            "required": {
-                "string1": ("STRING", {"default": "", "forceInput": True}),
-                "string2": ("STRING", {"default": "", "forceInput": True}),
-            },
-            "optional": {
-                "separator": ("STRING", {"default": "_"}),
-            },
-        }
+        return _STRING_CONCATENATE_INPUT_TYPES
 
     RETURN_TYPES = ("STRING",)
     FUNCTION = "execute"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def execute(self, string1, string2, separator="_"):
-        return (string1 + separator + string2,)
+        return (separator.join((string1, string2)),)
 
 
-# Hack: string type that is always equal in not equal comparisons
+# Hack: string type that is always equal in not equal comparisons.
+# ComfyUI validates linked inputs with `received_type != input_type` in execution.validate_inputs (older versions
+# don't special case "*"), the reflected __ne__ of this subclass makes any type pass. `==` is left untouched.
 class AnyType(str):
     def __ne__(self, __value: object) -> bool:
         return False
@@ -221,30 +301,49 @@ class AnyType(str):
 _any = AnyType("*")
 
 
+_SWITCH_INPUT_TYPES = {
+    "required": {
+        "if_true": (_any, {}),
+        "if_false": (_any, {}),
+        "switcher": (
+            "BOOLEAN",
+            {"default": True, "forceInput": True},
+        ),
+    },
+}
+
+
 class Switch:
     """Switch to one branch or another depending on the bool value"""
 
     @classmethod
     def INPUT_TYPES(cls):  # noqa N802
-        return {
-            "required": {
-                "if_true": (_any, {}),
-                "if_false": (_any, {}),
-                "switcher": (
-                    "BOOLEAN",
-                    {"default": True, "forceInput": True},
-                ),
-            },
-        }
+        return _SWITCH_INPUT_TYPES
 
     RETURN_TYPES = (_any,)
     INPUT_IS_LIST = True  # need this or it will crash
     OUTPUT_IS_LIST = (True,)
     FUNCTION = "execute"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def execute(self, if_true: _any, if_false: _any, switcher: list[bool]):
-        return (if_true if switcher[0] else if_false,)
+        # with INPUT_IS_LIST every input is a list, so the bool is the first item
+        return (if_true,) if switcher[0] else (if_false,)
+
+
+_INVERT_BOOL_INPUT_TYPES = {
+    "required": {
+        "value": (
+            "BOOLEAN",
+            {"default": True, "forceInput": True},
+        ),
+    },
+}
+
+
+# shared outputs of InvertBool, there are only two possible results
+_INVERTED_TRUE = (False,)
+_INVERTED_FALSE = (True,)
 
 
 class InvertBool:
@@ -252,21 +351,24 @@ class InvertBool:
 
     @classmethod
     def INPUT_TYPES(cls):  # noqa N802
-        return {
-            "required": {
-                "value": (
-                    "BOOLEAN",
-                    {"default": True, "forceInput": True},
-                ),
-            },
-        }
+        return _INVERT_BOOL_INPUT_TYPES
 
     RETURN_TYPES = ("BOOLEAN",)
     FUNCTION = "execute"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def execute(self, value: bool):
-        return (not value,)
+        return _INVERTED_TRUE if value else _INVERTED_FALSE
+
+
+_STR_TO_LIST_INPUT_TYPES = {
+    "required": {
+        "value": (
+            "STRING",
+            {"forceInput": True},
+        ),
+    },
+}
 
 
 class StrToList:
@@ -274,19 +376,14 @@ class StrToList:
 
     @classmethod
     def INPUT_TYPES(cls):  # noqa N802
-        return {
-            "required": {
-                "value": (
-                    "STRING",
-                    {"forceInput": True},
-                ),
-            },
-        }
+        return _STR_TO_LIST_INPUT_TYPES
 
     RETURN_TYPES = ("STRING",)
     OUTPUT_IS_LIST = (True,)
     FUNCTION = "execute"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def execute(self, value: str):
+        # OUTPUT_IS_LIST outputs must be lists: ComfyUI extends its results with them, a bare str would be split
+        # into characters. Single-item list, do not optimize further.
         return ([value],)
@@ -16,15 +16,16 @@
 """
 
 import pathlib
+import sys
 
-from .common import add_context_input_enabled_and_output
+from .common import ContextNode
 from .constant import PREFIX_MENU
 
-_file_name = pathlib.Path(__file__).stem
+_file_name = __name__.rsplit(".", 1)[-1]
+_CATEGORY = sys.intern(f"{PREFIX_MENU}/{_file_name}")
 
 
-@add_context_input_enabled_and_output
-class DeleteFile:
+class DeleteFile(ContextNode):
     """Delete a file from the disk"""
 
     @classmethod
@@ -41,7 +42,7 @@ class DeleteFile:
     RETURN_TYPES = ("BOOL",)
     RETURN_NAMES = ("File deleted",)
     FUNCTION = "execute"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def execute(self, path: str):
         if not self.enable_this_node:  # noqa
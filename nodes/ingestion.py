@@ -18,6 +18,7 @@
 import json
 import os
 import pathlib
+import sys
 
 import folder_paths
 import numpy as np
@@ -25,15 +26,15 @@ import requests
 import torch
 from PIL import Image
 
-from .common import add_context_input_enabled_and_output
+from .common import ContextNode
 from .constant import HEADER_LSS_REMIX_VERSION_1_0, PREFIX_MENU
 from .utils import check_response_status_code
 
-_file_name = pathlib.Path(__file__).stem
+_file_name = __name__.rsplit(".", 1)[-1]
+_CATEGORY = sys.intern(f"{PREFIX_MENU}/{_file_name}")
 
 
-@add_context_input_enabled_and_output
-class IngestTexture:
+class IngestTexture(ContextNode):
     """Ingest an image as a texture and save it to disk"""
 
     @classmethod
@@ -84,7 +85,7 @@ class IngestTexture:
 
     RETURN_NAMES = ("texture_path",)
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def ingest_texture(
         self,
@@ -96,7 +97,7 @@ class IngestTexture:
     ):
         if not self.enable_this_node:  # noqa
             return ("",)
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         if enable_override_output_folder:
             if not pathlib.Path(override_output_folder).exists():
                 raise FileNotFoundError("Can't overwrite output folder, folder doesn't exist.")
@@ -20,15 +20,12 @@ import collections
 import json
 import pathlib
 import re
+import sys
 from urllib.parse import quote_plus, unquote
 
 import requests
 
-from .common import (
-    RemixContext,
-    add_context_input_enabled_and_output,
-    get_context_inputs,
-)
+from .common import ContextNode, RemixContext, get_context_inputs
 from .constant import HEADER_LSS_REMIX_VERSION_1_0, PREFIX_MENU
 from .utils import check_response_status_code, merge_dict, posix
 
@@ -43,7 +40,8 @@ _layer_types = [
 ]  # RestAPI should not be called here. Or if there is a crash, the whole graph would not load
 
 
-_file_name = pathlib.Path(__file__).stem
+_file_name = __name__.rsplit(".", 1)[-1]
+_CATEGORY = sys.intern(f"{PREFIX_MENU}/{_file_name}")
 
 
 def stringify_layer_type(layer_type: str | None) -> str:
@@ -100,7 +98,7 @@ class DefineLayerId:
     RETURN_NAMES = ("layer_id",)
 
     FUNCTION = "execute"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def execute(
         self,
@@ -115,8 +113,7 @@ class DefineLayerId:
         return (layer_id.as_posix(),)
 
 
-@add_context_input_enabled_and_output
-class CreateLayer:
+class CreateLayer(ContextNode):
     """Create or Insert a sublayer in the current stage"""
 
     @classmethod
@@ -158,7 +155,7 @@ class CreateLayer:
 
     OUTPUT_NODE = False
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def create_layer(
         self,
@@ -182,15 +179,14 @@ class CreateLayer:
             "replace_existing": replace_existing,
         }
         data = json.dumps(payload)
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         r = requests.post(f"http://{address}:{port}/stagecraft/layers", data=data, headers=HEADER_LSS_REMIX_VERSION_1_0)
         check_response_status_code(r)
 
         return (layer_id,)
 
 
-@add_context_input_enabled_and_output
-class LayerType:
+class LayerType(ContextNode):
     """Select from a list of supported layer types."""
 
     @classmethod
@@ -208,7 +204,7 @@ class LayerType:
 
     FUNCTION = "get_layer_type"
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def get_layer_type(self, layer_type: str) -> tuple[str]:
         if not self.enable_this_node:  # noqa
@@ -217,8 +213,7 @@ class LayerType:
         return (layer_type,)
 
 
-@add_context_input_enabled_and_output
-class LayerTypes:
+class LayerTypes(ContextNode):
     """Select multiple layer types from a list of supported layer types."""
 
     @classmethod
@@ -242,7 +237,7 @@ class LayerTypes:
 
     FUNCTION = "get_layer_types"
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def get_layer_types(self, layer_types: str) -> tuple[str]:
         if not self.enable_this_node:  # noqa
@@ -252,8 +247,7 @@ class LayerTypes:
         return (layer_types,)
 
 
-@add_context_input_enabled_and_output
-class GetLayers:
+class GetLayers(ContextNode):
     """Query layer ids from the currently open project"""
 
     @classmethod
@@ -302,7 +296,7 @@ class GetLayers:
 
     FUNCTION = "execute"
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def execute(
         self,
@@ -320,7 +314,7 @@ class GetLayers:
             "layer_types": layer_types_list,
             "layer_count": layer_count,
         }
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         if parent_layer_id:
             r = requests.get(
                 f"http://{address}:{port}/stagecraft/layers/{quote_plus(posix(parent_layer_id))}/sublayers",
@@ -387,15 +381,14 @@ class _LayerOp:
 
     FUNCTION = "execute"
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     @abc.abstractmethod
     def execute(self, layer_id: str) -> tuple[str]:
         raise NotImplementedError()
 
 
-@add_context_input_enabled_and_output
-class MuteLayer(_LayerOp):
+class MuteLayer(_LayerOp, ContextNode):
     """Mute or unmute a project layer"""
 
     @classmethod
@@ -418,7 +411,7 @@ class MuteLayer(_LayerOp):
         if not self.enable_this_node:  # noqa
             return ("",)
         payload = {"value": mute}
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         r = requests.put(
             f"http://{address}:{port}/stagecraft/layers/{quote_plus(posix(layer_id))}/mute",
             data=json.dumps(payload),
@@ -428,8 +421,7 @@ class MuteLayer(_LayerOp):
         return (layer_id,)
 
 
-@add_context_input_enabled_and_output
-class RemoveLayer(_LayerOp):
+class RemoveLayer(_LayerOp, ContextNode):
     """Remove a layer from the project"""
 
     @classmethod
@@ -449,7 +441,7 @@ class RemoveLayer(_LayerOp):
         if not self.enable_this_node:  # noqa
             return ("",)
         payload = {"parent_layer_id": posix(parent_layer_id)}
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         r = requests.delete(
             f"http://{address}:{port}/stagecraft/layers/{quote_plus(posix(layer_id))}",
             data=json.dumps(payload),
@@ -459,14 +451,13 @@ class RemoveLayer(_LayerOp):
         return (layer_id,)
 
 
-@add_context_input_enabled_and_output
-class SaveLayer(_LayerOp):
+class SaveLayer(_LayerOp, ContextNode):
     """Save a project layer"""
 
     def execute(self, layer_id: str) -> tuple[str]:
         if not self.enable_this_node:  # noqa
             return ("",)
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         r = requests.post(
             f"http://{address}:{port}/stagecraft/layers/{quote_plus(posix(layer_id))}/save",
             headers=HEADER_LSS_REMIX_VERSION_1_0,
@@ -475,8 +466,7 @@ class SaveLayer(_LayerOp):
         return (layer_id,)
 
 
-@add_context_input_enabled_and_output
-class GetEditTarget:
+class GetEditTarget(ContextNode):
     """Get the edit target from the currently open project"""
 
     @classmethod
@@ -490,12 +480,12 @@ class GetEditTarget:
 
     OUTPUT_NODE = False
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def get_edit_target(self, context: RemixContext) -> tuple[str]:
         if not self.enable_this_node:  # noqa
             return ("",)
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         r = requests.get(f"http://{address}:{port}/stagecraft/layers/target", headers=HEADER_LSS_REMIX_VERSION_1_0)
         check_response_status_code(r)
 
@@ -509,14 +499,13 @@ class GetEditTarget:
         return float("nan")
 
 
-@add_context_input_enabled_and_output
-class SetEditTarget(_LayerOp):
+class SetEditTarget(_LayerOp, ContextNode):
     """Designate the edit target on the open project to receive modifications"""
 
     def execute(self, layer_id: str) -> tuple[str]:
         if not self.enable_this_node:  # noqa
             return ("",)
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         r = requests.put(
             f"http://{address}:{port}/stagecraft/layers/target/{quote_plus(posix(layer_id))}",
             headers=HEADER_LSS_REMIX_VERSION_1_0,
@@ -17,13 +17,14 @@
 
 import json
 import pathlib
+import sys
 
 import numpy as np
 import requests
 import torch
 from PIL import Image, ImageOps
 
-from .common import add_context_input_enabled_and_output
+from .common import ContextNode
 from .constant import HEADER_LSS_REMIX_VERSION_1_0, PREFIX_MENU
 from .utils import check_response_status_code, posix
 
@@ -44,7 +45,8 @@ _texture_types = [
 ]  # RestAPI should not be called here. Or if there is a crash, the whole graph would not load
 
 
-_file_name = pathlib.Path(__file__).stem
+_file_name = __name__.rsplit(".", 1)[-1]
+_CATEGORY = sys.intern(f"{PREFIX_MENU}/{_file_name}")
 
 
 def validate_texture_types(texture_types: list[str], address: str, port: str):
@@ -61,8 +63,7 @@ def validate_texture_types(texture_types: list[str], address: str, port: str):
             )
 
 
-@add_context_input_enabled_and_output
-class GetTextures:
+class GetTextures(ContextNode):
     """Read the textures matching provided criteria from the currently open project"""
 
     @classmethod
@@ -130,7 +131,7 @@ class GetTextures:
     )
 
     FUNCTION = "get_texture_prims_assets"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def get_texture_prims_assets(
         self,
@@ -153,7 +154,7 @@ class GetTextures:
         if layer_id is not None:
             payload["layer_identifier"] = posix(layer_id)
 
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         r = requests.get(
             f"http://{address}:{port}/stagecraft/textures", params=payload, headers=HEADER_LSS_REMIX_VERSION_1_0
         )
@@ -201,8 +202,7 @@ class GetTextures:
         return float("nan")
 
 
-@add_context_input_enabled_and_output
-class TexturesTypes:
+class TexturesTypes(ContextNode):
     """Select multiple texture types from a list of supported texture types."""
 
     @classmethod
@@ -226,7 +226,7 @@ class TexturesTypes:
     RETURN_NAMES = ("texture_types",)
 
     FUNCTION = "get_texture_types"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def get_texture_types(self, texture_types: str) -> tuple[str]:
         if not self.enable_this_node:  # noqa
@@ -237,8 +237,7 @@ class TexturesTypes:
         return (texture_types,)
 
 
-@add_context_input_enabled_and_output
-class TexturesType:
+class TexturesType(ContextNode):
     """Select from a list of supported texture types."""
 
     @classmethod
@@ -255,7 +254,7 @@ class TexturesType:
     RETURN_NAMES = ("texture_type",)
 
     FUNCTION = "get_texture_type"
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def get_texture_type(self, texture_type: str) -> tuple[str]:
         if not self.enable_this_node:  # noqa
@@ -264,8 +263,7 @@ class TexturesType:
         return (texture_type,)
 
 
-@add_context_input_enabled_and_output
-class SetTexture:
+class SetTexture(ContextNode):
     """Set the texture path on an asset"""
 
     @classmethod
@@ -289,7 +287,7 @@ class SetTexture:
     RETURN_TYPES = ()
     RETURN_NAMES = ()
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def set_texture(self, usd_attribute: str, texture_path: str, force: bool = False):
 
@@ -300,7 +298,7 @@ class SetTexture:
 
         data = json.dumps(payload)
 
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         r = requests.put(
             f"http://{address}:{port}/stagecraft/textures", data=data, headers=HEADER_LSS_REMIX_VERSION_1_0
         )
@@ -309,8 +307,7 @@ class SetTexture:
         return ()  # need to return something
 
 
-@add_context_input_enabled_and_output
-class TextureTypeToUSDAttribute:
+class TextureTypeToUSDAttribute(ContextNode):
     """Use this node to get the proper texture attribute on the same asset but for a different texture type"""
 
     @classmethod
@@ -336,14 +333,14 @@ class TextureTypeToUSDAttribute:
 
     RETURN_NAMES = ("usd_attribute",)
 
-    CATEGORY = f"{PREFIX_MENU}/{_file_name}"
+    CATEGORY = _CATEGORY
 
     def get_attr_from_texture_type(self, usd_attribute: str, texture_type: str):
 
         if not self.enable_this_node:  # noqa
             return ("",)
 
-        address, port = self.context  # noqa
+        address, port = self.context.address, self.context.port
         r = requests.get(
             f"http://{address}:{port}/stagecraft/textures/{usd_attribute}/material/inputs",
             params={"texture_type": texture_type},